@@ -3,19 +3,24 @@
 MySQL MCP Server - 配置优化版本
 提供MySQL数据库的创建表、增删改查等操作功能
 支持通过环境变量和命令行参数配置数据库连接
+返回JSON的工具中，select_data使用orjson序列化，get_database_info使用msgspec序列化
 """
 
 import asyncio
-import json
 import logging
 import sys
 import os
 import argparse
-from typing import Any, Dict, List, Optional
+import re
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 
-import aiomysql
+import asyncmy
+from asyncmy.cursors import SSDictCursor
+import msgspec
+import orjson
 from mcp.server.fastmcp import FastMCP
-from mcp.server.stdio import stdio_server
 
 # 配置日志
 logging.basicConfig(
@@ -27,14 +32,38 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# 优先使用基于libuv的uvloop事件循环，未安装（如Windows平台）时回退到asyncio默认事件循环
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
 ## 从环境变量获取端口，如果没有则使用默认端口
 port = int(os.environ.get('FC_SERVER_PORT', '9000'))
 host = os.environ.get('FC_SERVER_HOST', '0.0.0.0')
 # 在创建FastMCP实例时传递host和port参数
+# 注：MCP传输层的消息编解码由pydantic-core(Rust实现)完成，并非标准库json，无需再替换
 app = FastMCP("mysql-mcp-server", host=host, port=port)
 #app = FastMCP("mysql-mcp-server")
 
+# 连接池常驻连接数：服务启动时即建立，避免请求路径上建立新连接的握手开销
+POOL_MINSIZE = 5
+POOL_MAXSIZE = 20
+# 建立连接时放宽GROUP_CONCAT结果长度限制（默认仅1024字节），供show_tables在服务端拼接表列表
+POOL_INIT_COMMAND = "SET SESSION group_concat_max_len = 4294967295"
+# 每个连接缓存的服务端预处理语句数：带参数执行的语句（如insert_data）按SQL文本缓存，
+# 重复执行时走二进制协议，省去服务端重复解析
+STMT_CACHE_SIZE = 256
+# 空闲连接保活间隔（秒），需小于MySQL的wait_timeout（默认28800秒）
+POOL_KEEPALIVE_INTERVAL = 1800
+# asyncmy默认pool_recycle=3600，按最近一次conn.cursor()的时间回收连接（ping不会刷新该时间）；
+# 连接可用性改由保活任务保证，因此显式设为-1关闭回收，避免连接在请求路径上被关闭并重新握手
+POOL_RECYCLE = -1
+
 class MySQLManager:
+    # 属性集合固定，使用__slots__省去实例__dict__
+    __slots__ = ('db_config', 'pool', '_lock', '_keepalive_task', '_config_info_cached')
+    
     def __init__(self, host=None, port=None, user=None, password=None, database=None):
         """
         初始化MySQL管理器
@@ -58,58 +87,88 @@ class MySQLManager:
         }
         self.pool = None
         self._lock = asyncio.Lock()
+        self._keepalive_task = None
         
         # 验证必要的配置
         if not self.db_config['password']:
             logger.warning("数据库密码为空，请确保这是预期的配置")
+        
+        # 配置在初始化后不再变化，预先计算隐藏密码后的配置信息
+        self._config_info_cached = self.db_config.copy()
+        self._config_info_cached['password'] = '*' * len(self.db_config['password']) if self.db_config['password'] else 'Empty'
     
     def get_config_info(self):
-        """获取配置信息（隐藏密码）"""
-        config_info = self.db_config.copy()
-        config_info['password'] = '*' * len(config_info['password']) if config_info['password'] else 'Empty'
-        return config_info
+        """获取配置信息（隐藏密码），调用方不应修改返回的字典"""
+        return self._config_info_cached
+    
+    async def init_pool(self):
+        """确保连接池已创建，服务启动时调用以预先建立连接"""
+        # 双重检查：仅在首次创建连接池时加锁，之后直接从连接池获取连接
+        if self.pool is None:
+            async with self._lock:
+                if self.pool is None:
+                    try:
+                        logger.info("正在连接数据库: %s:%s", self.db_config['host'], self.db_config['port'])
+                        self.pool = await asyncmy.create_pool(
+                            host=self.db_config['host'],
+                            port=self.db_config['port'],
+                            user=self.db_config['user'],
+                            password=self.db_config['password'],
+                            db=self.db_config['db'],
+                            charset=self.db_config['charset'],
+                            autocommit=self.db_config['autocommit'],
+                            minsize=POOL_MINSIZE,
+                            maxsize=POOL_MAXSIZE,
+                            connect_timeout=10,
+                            pool_recycle=POOL_RECYCLE,
+                            stmt_cache_size=STMT_CACHE_SIZE,
+                            init_command=POOL_INIT_COMMAND
+                        )
+                        self._keepalive_task = asyncio.create_task(self._keepalive(POOL_KEEPALIVE_INTERVAL))
+                        logger.info("数据库连接池创建成功")
+                    except Exception as e:
+                        logger.error("创建数据库连接池失败: %s", e)
+                        raise
     
-    async def get_connection(self):
-        """获取数据库连接"""
-        async with self._lock:
-            if not self.pool:
+    async def _keepalive(self, interval):
+        """
+        定期逐个取出空闲连接执行ping，避免空闲连接因超过wait_timeout被MySQL服务端断开；
+        ping默认reconnect=True，已断开的连接会在此处重连，而不是在请求路径上重连
+        """
+        while True:
+            await asyncio.sleep(interval)
+            # 连接池按先进先出复用空闲连接，依次取出再归还即可覆盖所有空闲连接
+            for _ in range(self.pool.freesize):
                 try:
-                    logger.info(f"正在连接数据库: {self.db_config['host']}:{self.db_config['port']}")
-                    self.pool = await aiomysql.create_pool(
-                        host=self.db_config['host'],
-                        port=self.db_config['port'],
-                        user=self.db_config['user'],
-                        password=self.db_config['password'],
-                        db=self.db_config['db'],
-                        charset=self.db_config['charset'],
-                        autocommit=self.db_config['autocommit'],
-                        minsize=1,
-                        maxsize=5,
-                        connect_timeout=10,
-                        pool_recycle=3600
-                    )
-                    logger.info("数据库连接池创建成功")
+                    async with self.pool.acquire() as conn:
+                        await conn.ping()
                 except Exception as e:
-                    logger.error(f"创建数据库连接池失败: {e}")
-                    raise
-        
-        try:
-            conn = await self.pool.acquire()
-            return conn
-        except Exception as e:
-            logger.error(f"获取数据库连接失败: {e}")
-            raise
+                    logger.warning("连接保活失败: %s", e)
     
-    async def release_connection(self, conn):
-        """释放数据库连接"""
-        if conn and self.pool:
+    @asynccontextmanager
+    async def acquire(self):
+        """获取数据库连接，退出上下文时自动归还连接池（包括异常和任务取消的情况）"""
+        # 连接池创建后只需一次属性读取，不再进入init_pool协程
+        if self.pool is None:
+            await self.init_pool()
+        async with self.pool.acquire() as conn:
             try:
-                await self.pool.release(conn)
-            except Exception as e:
-                logger.error(f"释放数据库连接失败: {e}")
+                yield conn
+            finally:
+                # 缓存游标会保留上一条语句的结果行，归还连接前清空，避免空闲连接长期占用内存
+                cursor = getattr(conn, '_cached_cursor', None)
+                if cursor is not None:
+                    cursor._clear_result()
     
     async def close_pool(self):
         """关闭连接池"""
+        if self._keepalive_task:
+            self._keepalive_task.cancel()
+            try:
+                await self._keepalive_task
+            except asyncio.CancelledError:
+                pass
+            self._keepalive_task = None
         if self.pool:
             try:
                 self.pool.close()
@@ -117,11 +176,72 @@ class MySQLManager:
                 self.pool = None
                 logger.info("数据库连接池已关闭")
             except Exception as e:
-                logger.error(f"关闭连接池失败: {e}")
+                logger.error("关闭连接池失败: %s", e)
+
+class DBInfo(msgspec.Struct):
+    """get_database_info返回的数据库信息，字段固定，由msgspec一次编码为紧凑JSON"""
+    host: str
+    port: int
+    user: str
+    password: str
+    db: str
+    charset: str
+    autocommit: bool
+    mysql_version: str
+    # 未选择数据库时SELECT DATABASE()返回NULL
+    current_database: Optional[str]
+    connection_status: str
 
-# 全局MySQL管理器实例（将在main函数中初始化）
+# 全局MySQL管理器实例（将在程序入口处初始化）
 mysql_manager = None
 
+# 合法的表名/列名：仅允许字母、数字和下划线（含Unicode字母，如中文）
+_IDENT = re.compile(r'\w+')
+
+def _validate_identifier(name: str) -> str:
+    """校验表名/列名，防止通过标识符拼接注入SQL"""
+    if not isinstance(name, str) or not _IDENT.fullmatch(name):
+        raise ValueError(f"非法的标识符: {name!r}")
+    return name
+
+def _cached_cursor(conn):
+    """
+    获取缓存在连接上的默认游标，连接被连接池复用时游标也随之复用
+    
+    asyncmy仅在conn.cursor()中刷新连接的最近使用时间，缓存游标后该时间不再更新；
+    连接池已关闭按该时间回收连接（POOL_RECYCLE = -1），因此不受影响
+    """
+    cursor = getattr(conn, '_cached_cursor', None)
+    if cursor is None:
+        cursor = conn.cursor()
+        conn._cached_cursor = cursor
+    return cursor
+
+@lru_cache(maxsize=1024)
+def _insert_sql(table: str, cols: Tuple[str, ...]) -> str:
+    """构建INSERT语句模板，相同的表和列组合直接复用缓存结果"""
+    _validate_identifier(table)
+    column_names = ', '.join([f"`{_validate_identifier(col)}`" for col in cols])
+    placeholders = ', '.join(['%s'] * len(cols))
+    return f"INSERT INTO `{table}` ({column_names}) VALUES ({placeholders})"
+
+@lru_cache(maxsize=1024)
+def _select_sql(table: str, cols: Tuple[str, ...]) -> str:
+    """构建SELECT语句模板（不含WHERE和LIMIT），相同的表和列组合直接复用缓存结果"""
+    _validate_identifier(table)
+    if cols == ("*",):
+        column_str = "*"
+    else:
+        column_str = ', '.join([f"`{_validate_identifier(col)}`" for col in cols])
+    return f"SELECT {column_str} FROM `{table}`"
+
+@lru_cache(maxsize=1024)
+def _update_sql(table: str, cols: Tuple[str, ...]) -> str:
+    """构建UPDATE语句模板（不含WHERE），相同的表和列组合直接复用缓存结果"""
+    _validate_identifier(table)
+    set_clause = ', '.join([f"`{_validate_identifier(col)}` = %s" for col in cols])
+    return f"UPDATE `{table}` SET {set_clause}"
+
 @app.tool()
 async def create_table(table_name: str, columns: List[Dict[str, str]]) -> str:
     """
@@ -134,30 +254,28 @@ async def create_table(table_name: str, columns: List[Dict[str, str]]) -> str:
     Returns:
         创建结果消息
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            # 构建CREATE TABLE语句
-            column_defs = []
-            for col in columns:
-                col_def = f"`{col['name']}` {col['type']}"
-                if col.get('constraints'):
-                    col_def += f" {col['constraints']}"
-                column_defs.append(col_def)
-            
-            sql = f"CREATE TABLE IF NOT EXISTS `{table_name}` ({', '.join(column_defs)})"
+        # 构建CREATE TABLE语句
+        _validate_identifier(table_name)
+        column_defs = []
+        for col in columns:
+            col_def = f"`{_validate_identifier(col['name'])}` {col['type']}"
+            if col.get('constraints'):
+                col_def += f" {col['constraints']}"
+            column_defs.append(col_def)
+        
+        sql = f"CREATE TABLE IF NOT EXISTS `{table_name}` ({', '.join(column_defs)})"
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
             await cursor.execute(sql)
-            logger.info(f"表 '{table_name}' 创建成功")
-            return f"表 '{table_name}' 创建成功"
+            result_msg = f"表 '{table_name}' 创建成功"
+            logger.info(result_msg)
+            return result_msg
     
     except Exception as e:
         error_msg = f"创建表失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
 
 @app.tool()
 async def insert_data(table_name: str, data: Dict[str, Any]) -> str:
@@ -171,17 +289,11 @@ async def insert_data(table_name: str, data: Dict[str, Any]) -> str:
     Returns:
         插入结果消息
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            columns = list(data.keys())
-            values = list(data.values())
-            placeholders = ', '.join(['%s'] * len(values))
-            column_names = ', '.join([f"`{col}`" for col in columns])
-            
-            sql = f"INSERT INTO `{table_name}` ({column_names}) VALUES ({placeholders})"
-            await cursor.execute(sql, values)
+        sql = _insert_sql(table_name, tuple(data.keys()))
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
+            await cursor.execute(sql, tuple(data.values()))
             result_msg = f"数据插入成功，受影响行数: {cursor.rowcount}"
             logger.info(result_msg)
             return result_msg
@@ -190,9 +302,64 @@ async def insert_data(table_name: str, data: Dict[str, Any]) -> str:
         error_msg = f"插入数据失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
+
+# 批量插入时每条INSERT语句包含的最大行数，避免超过max_allowed_packet
+BULK_INSERT_CHUNK_SIZE = 1000
+
+@app.tool()
+async def bulk_insert_data(table_name: str, rows: List[Dict[str, Any]]) -> str:
+    """
+    向表中批量插入数据
+
+    Args:
+        table_name: 表名
+        rows: 要插入的数据列表，每个元素为键值对形式，且所有元素的键必须一致；
+              整批数据在同一事务中插入，失败时全部回滚
+
+    Returns:
+        插入结果消息
+    """
+    if not rows:
+        return "没有需要插入的数据"
+
+    columns = list(rows[0].keys())
+    column_set = set(columns)
+    for index, row in enumerate(rows):
+        if set(row.keys()) != column_set:
+            error_msg = f"批量插入数据失败: 第{index + 1}行的列与第1行不一致"
+            logger.error(error_msg)
+            return error_msg
+
+    try:
+        # executemany会将INSERT ... VALUES改写为多行VALUES，一次往返插入整批数据
+        sql = _insert_sql(table_name, tuple(columns))
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
+            affected_rows = 0
+            # 所有分块在同一事务中提交，任一分块失败则整批回滚，避免部分插入
+            await conn.begin()
+            try:
+                for start in range(0, len(rows), BULK_INSERT_CHUNK_SIZE):
+                    chunk = rows[start:start + BULK_INSERT_CHUNK_SIZE]
+                    await cursor.executemany(sql, [tuple(row[col] for col in columns) for row in chunk])
+                    affected_rows += cursor.rowcount
+                await conn.commit()
+            except BaseException:
+                # 包括任务取消，确保连接归还连接池前事务已回滚
+                await conn.rollback()
+                raise
+
+            result_msg = f"批量插入数据成功，受影响行数: {affected_rows}"
+            logger.info(result_msg)
+            return result_msg
+
+    except Exception as e:
+        error_msg = f"批量插入数据失败: {str(e)}"
+        logger.error(error_msg)
+        return error_msg
+
+# 流式查询时每次从服务端读取并序列化的行数
+SELECT_FETCH_CHUNK_SIZE = 1000
 
 @app.tool()
 async def select_data(table_name: str, columns: Optional[List[str]] = None, 
@@ -212,40 +379,40 @@ async def select_data(table_name: str, columns: Optional[List[str]] = None,
     if columns is None:
         columns = ["*"]
     
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor(aiomysql.DictCursor) as cursor:
-            if columns == ["*"]:
-                column_str = "*"
-            else:
-                column_str = ', '.join([f"`{col}`" for col in columns])
-            
-            sql = f"SELECT {column_str} FROM `{table_name}`"
-            if where_clause:
-                sql += f" WHERE {where_clause}"
-            sql += f" LIMIT {limit}"
-            
-            await cursor.execute(sql)
-            results = await cursor.fetchall()
-            
-            if not results:
-                return "未找到数据"
-            
-            # 格式化结果
-            formatted_results = []
-            for row in results:
-                formatted_results.append(dict(row))
-            
-            return json.dumps(formatted_results, ensure_ascii=False, indent=2, default=str)
+        sql = _select_sql(table_name, tuple(columns))
+        if where_clause:
+            sql += f" WHERE {where_clause}"
+        sql += f" LIMIT {int(limit)}"
+        
+        async with mysql_manager.acquire() as conn:
+            # 使用服务端游标流式读取，避免一次性将全部结果加载到内存
+            async with conn.cursor(SSDictCursor) as cursor:
+                await cursor.execute(sql)
+                
+                # 按块读取并序列化：每块用orjson编码后去掉外层的"[\n"与"\n]"，
+                # 最后拼接的结果与一次性序列化整个列表完全一致
+                chunks = []
+                while True:
+                    rows = await cursor.fetchmany(SELECT_FETCH_CHUNK_SIZE)
+                    if not rows:
+                        break
+                    chunks.append(orjson.dumps(
+                        rows,
+                        # 日期时间交给default=str处理，保持与原json.dumps一致的"YYYY-MM-DD HH:MM:SS"格式
+                        option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME,
+                        default=str
+                    )[2:-2])
+                
+                if not chunks:
+                    return "未找到数据"
+                
+                return (b"[\n" + b",\n".join(chunks) + b"\n]").decode('utf-8')
     
     except Exception as e:
         error_msg = f"查询数据失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
 
 @app.tool()
 async def update_data(table_name: str, data: Dict[str, Any], where_clause: str) -> str:
@@ -260,16 +427,13 @@ async def update_data(table_name: str, data: Dict[str, Any], where_clause: str)
     Returns:
         更新结果消息
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            set_clauses = [f"`{key}` = %s" for key in data.keys()]
-            set_clause = ', '.join(set_clauses)
-            values = list(data.values())
-            
-            sql = f"UPDATE `{table_name}` SET {set_clause} WHERE {where_clause}"
-            await cursor.execute(sql, values)
+        sql = f"{_update_sql(table_name, tuple(data.keys()))} WHERE {where_clause}"
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
+            # WHERE子句每次不同，SQL文本无法复用预处理语句，在客户端填充参数后走文本协议，
+            # 避免每次调用都多一次PREPARE往返并挤占预处理语句缓存
+            await cursor.execute(cursor.mogrify(sql, tuple(data.values())))
             result_msg = f"数据更新成功，受影响行数: {cursor.rowcount}"
             logger.info(result_msg)
             return result_msg
@@ -278,9 +442,6 @@ async def update_data(table_name: str, data: Dict[str, Any], where_clause: str)
         error_msg = f"更新数据失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
 
 @app.tool()
 async def delete_data(table_name: str, where_clause: str) -> str:
@@ -294,11 +455,10 @@ async def delete_data(table_name: str, where_clause: str) -> str:
     Returns:
         删除结果消息
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            sql = f"DELETE FROM `{table_name}` WHERE {where_clause}"
+        sql = f"DELETE FROM `{_validate_identifier(table_name)}` WHERE {where_clause}"
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
             await cursor.execute(sql)
             result_msg = f"数据删除成功，受影响行数: {cursor.rowcount}"
             logger.info(result_msg)
@@ -308,9 +468,6 @@ async def delete_data(table_name: str, where_clause: str) -> str:
         error_msg = f"删除数据失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
 
 @app.tool()
 async def show_tables() -> str:
@@ -320,26 +477,33 @@ async def show_tables() -> str:
     Returns:
         表列表字符串
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            await cursor.execute("SHOW TABLES")
-            tables = await cursor.fetchall()
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
+            # 由MySQL直接拼接表列表，只需读取一行结果；
+            # 分隔符中直接使用换行字符而非转义序列，在NO_BACKSLASH_ESCAPES模式下同样有效
+            await cursor.execute(
+                "SELECT COUNT(*), GROUP_CONCAT(TABLE_NAME ORDER BY TABLE_NAME SEPARATOR '\n- ') "
+                "FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE()"
+            )
+            table_count, table_str = await cursor.fetchone()
             
-            if not tables:
+            if not table_count:
                 return "数据库中没有表"
             
-            table_list = [table[0] for table in tables]
-            return f"数据库中的表({len(table_list)}个):\n" + '\n'.join([f"- {table}" for table in table_list])
+            # 连接已放宽group_concat_max_len，结果仍被截断（如超过max_allowed_packet）时回退为逐行读取
+            if table_str.count('\n- ') + 1 != table_count:
+                await cursor.execute("SHOW TABLES")
+                tables = await cursor.fetchall()
+                table_count = len(tables)
+                table_str = '\n- '.join([table[0] for table in tables])
+            
+            return f"数据库中的表({table_count}个):\n- {table_str}"
     
     except Exception as e:
         error_msg = f"显示表失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
 
 @app.tool()
 async def get_database_info() -> str:
@@ -349,10 +513,9 @@ async def get_database_info() -> str:
     Returns:
         数据库信息
     """
-    conn = None
     try:
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
+        async with mysql_manager.acquire() as conn:
+            cursor = _cached_cursor(conn)
             # 获取数据库版本
             await cursor.execute("SELECT VERSION()")
             version = await cursor.fetchone()
@@ -363,39 +526,26 @@ async def get_database_info() -> str:
             
             # 获取连接信息
             config_info = mysql_manager.get_config_info()
-            info = {
-                **config_info,
-                "mysql_version": version[0] if version else "Unknown",
-                "current_database": current_db[0] if current_db else "None",
-                "connection_status": "Connected"
-            }
+            # 逐个传入字段，避免**展开时额外构建关键字参数字典
+            info = DBInfo(
+                host=config_info['host'],
+                port=config_info['port'],
+                user=config_info['user'],
+                password=config_info['password'],
+                db=config_info['db'],
+                charset=config_info['charset'],
+                autocommit=config_info['autocommit'],
+                mysql_version=version[0] if version else "Unknown",
+                current_database=current_db[0] if current_db else "None",
+                connection_status="Connected"
+            )
             
-            return json.dumps(info, ensure_ascii=False, indent=2)
+            return msgspec.json.encode(info).decode('utf-8')
     
     except Exception as e:
         error_msg = f"获取数据库信息失败: {str(e)}"
         logger.error(error_msg)
         return error_msg
-    finally:
-        if conn:
-            await mysql_manager.release_connection(conn)
-
-async def test_connection():
-    """测试数据库连接"""
-    try:
-        logger.info("正在测试数据库连接...")
-        conn = await mysql_manager.get_connection()
-        async with conn.cursor() as cursor:
-            await cursor.execute("SELECT 1")
-            result = await cursor.fetchone()
-            if result[0] == 1:
-                logger.info("数据库连接测试成功")
-                return True
-        await mysql_manager.release_connection(conn)
-    except Exception as e:
-        logger.error(f"数据库连接测试失败: {e}")
-        return False
-    return False
 
 def parse_arguments():
     """解析命令行参数，如果未提供则从环境变量中读取"""
@@ -405,6 +555,8 @@ def parse_arguments():
     parser.add_argument('--user', type=str, help='MySQL user (default: root)')
     parser.add_argument('--password', type=str, help='MySQL password')
     parser.add_argument('--database', type=str, help='MySQL database name (default: test01)')
+    parser.add_argument('--transport', type=str, choices=['sse', 'stdio'], default='sse',
+                        help='MCP transport (default: sse)')
     
     args = parser.parse_args()
     
@@ -424,51 +576,19 @@ def parse_arguments():
     
     return args
 
-async def main():
-    """主函数"""
-    global mysql_manager
-    
+async def main(transport):
+    """启动时创建连接池，运行MCP服务，退出时关闭连接池"""
     try:
-        logger.info("MySQL MCP Server 启动中...")
-        
-        # 解析命令行参数
-        args = parse_arguments()
+        # 在接受客户端请求前建立连接池并启动保活任务，首个请求无需等待建立连接
+        await mysql_manager.init_pool()
         
-        # 初始化MySQL管理器
-        mysql_manager = MySQLManager(
-            host=args.host,
-            port=args.port,
-            user=args.user,
-            password=args.password,
-            database=args.database
-        )
-        
-        # 显示配置信息
-        config_info = mysql_manager.get_config_info()
-        logger.info(f"数据库配置: {config_info}")
-        
-        # 测试数据库连接
-        if not await test_connection():
-            logger.error("数据库连接失败，服务器无法启动")
-            return
-        
-        # 使用stdio服务器运行MCP应用
-        async with stdio_server() as (read_stream, write_stream):
-            logger.info("MCP服务器正在运行...")
-            await app.run(
-                read_stream,
-                write_stream,
-                app.create_initialization_options()
-            )
-    
-    except KeyboardInterrupt:
-        logger.info("服务器收到中断信号，正在关闭...")
-    except Exception as e:
-        logger.error(f"服务器运行错误: {e}", exc_info=True)
+        # 按所选传输方式运行MCP服务
+        if transport == "stdio":
+            await app.run_stdio_async()
+        else:
+            await app.run_sse_async()
     finally:
-        # 清理资源
-        if mysql_manager:
-            await mysql_manager.close_pool()
+        await mysql_manager.close_pool()
         logger.info("服务器已关闭")
 
 if __name__ == "__main__":
@@ -482,9 +602,16 @@ if __name__ == "__main__":
             password=args.password,
             database=args.database
         )
+        logger.info("数据库配置: %s", mysql_manager.get_config_info())
         
         # 运行FastMCP应用
-        app.run(transport="sse")
+        if uvloop is not None:
+            uvloop.run(main(args.transport))
+        else:
+            logger.info("未安装uvloop，使用asyncio默认事件循环")
+            asyncio.run(main(args.transport))
+    except KeyboardInterrupt:
+        logger.info("服务器收到中断信号，已关闭")
     except Exception as e:
-        logger.error(f"程序启动失败: {e}", exc_info=True)
+        logger.error("程序启动失败: %s", e, exc_info=True)
         sys.exit(1)